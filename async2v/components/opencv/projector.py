@@ -145,6 +145,8 @@ class _ProjectorCalibrator2d(SubComponent):
             self.debug = None
         self._last_calibrated = 0
         self._transformation_matrix = None
+        self._blob_detector = None
+        self._blob_detector_input_size = None
 
     def reset(self) -> None:
         self._transformation_matrix = None
@@ -166,24 +168,25 @@ class _ProjectorCalibrator2d(SubComponent):
         elif action == 'wait':
             pass
         elif action == 'draw_pattern':
-            pattern = self._draw_pattern()
-            self._push_pattern_to_projector(pattern)
+            self._push_pattern_to_projector(self._pattern)
         elif action == 'clear_pattern':
             pattern = numpy.zeros(tuple(reversed(self.CANVAS_SIZE)), dtype=numpy.uint8)
             cv2.rectangle(pattern, (0, 0), self.CANVAS_SIZE, 128, self.CALIBRATION_PATTERN_GRID_SIZE)
             self._push_pattern_to_projector(pattern)
         elif action == 'calibrate_pattern':
             mask = self._background.apply(self.source.value.image, learningRate=0)
-            mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, self.KERNEL)
-            mask = cv2.blur(mask, (5, 5))
-            blob_detector = self._create_blob_detector()
-            found, centers = cv2.findCirclesGrid(mask, self._calibration_pattern_size,
-                                                 cv2.CALIB_CB_ASYMMETRIC_GRID + cv2.CALIB_CB_CLUSTERING,
-                                                 blob_detector, None)
+            cv2.morphologyEx(mask, cv2.MORPH_OPEN, self.KERNEL, dst=mask)
+            cv2.blur(mask, (5, 5), dst=mask)
+            blob_detector = self._get_blob_detector()
+            if cv2.countNonZero(mask):
+                found, centers = cv2.findCirclesGrid(mask, self._calibration_pattern_size,
+                                                     cv2.CALIB_CB_ASYMMETRIC_GRID + cv2.CALIB_CB_CLUSTERING,
+                                                     blob_detector, None)
+            else:
+                found, centers = False, None
             if self.debug:
-                output = self.source.value.image.copy()
                 blobs = blob_detector.detect(mask)
-                output = cv2.drawKeypoints(output, blobs, numpy.array([]), (0, 0, 255),
+                output = cv2.drawKeypoints(self.source.value.image, blobs, None, (0, 0, 255),
                                            cv2.DRAW_MATCHES_FLAGS_DRAW_RICH_KEYPOINTS)
                 cv2.drawChessboardCorners(output, self._calibration_pattern_size, centers, found)
                 self.debug.push(Frame(mask, 'projector.calibration.mask'))
@@ -197,8 +200,11 @@ class _ProjectorCalibrator2d(SubComponent):
         overlay = numpy.zeros(tuple(reversed(self.CANVAS_SIZE)), dtype=numpy.uint8)
         cv2.rectangle(overlay, (0, 0), self.CANVAS_SIZE, 128, self.CALIBRATION_PATTERN_GRID_SIZE)
         r = int(self.CALIBRATION_PATTERN_GRID_SIZE * 0.2)
-        for pos in self._calibration_pattern:
-            cv2.circle(overlay, pos, r, (255, 255, 255), -1)
+        yy, xx = numpy.ogrid[-r:r + 1, -r:r + 1]
+        disk = ((xx * xx + yy * yy) <= r * r).astype(numpy.uint8) * 255
+        for x, y in self._calibration_pattern:
+            target = overlay[y - r:y + r + 1, x - r:x + r + 1]
+            numpy.maximum(target, disk, out=target)
         return overlay
 
     def _initialize_pattern(self):
@@ -218,6 +224,8 @@ class _ProjectorCalibrator2d(SubComponent):
 
         self._calibration_pattern = circles
         self._calibration_pattern_size = (n_x, n_y)
+        self._pattern = self._draw_pattern()
+        self._pattern.flags.writeable = False
 
     def _calibration_action(self):
         n = 0
@@ -228,8 +236,15 @@ class _ProjectorCalibrator2d(SubComponent):
         else:
             raise RuntimeError(f'Invalid calibration state {self._calibration_cycle_i}')
 
-    def _create_blob_detector(self):
+    def _get_blob_detector(self):
         input_size = min(self.source.value.width, self.source.value.height)
+        if input_size != self._blob_detector_input_size:
+            self._blob_detector = self._create_blob_detector(input_size)
+            self._blob_detector_input_size = input_size
+        return self._blob_detector
+
+    @staticmethod
+    def _create_blob_detector(input_size: int):
         min_distance = int(input_size / 40)
         params = cv2.SimpleBlobDetector_Params()
         params.blobColor = 255
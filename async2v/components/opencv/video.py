@@ -1,16 +1,17 @@
 import argparse
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
-from typing import Tuple, List, Union
+import threading
+from dataclasses import dataclass, field
+from typing import Tuple, List, Union, Optional
 
 import sys
 
 from async2v import event
 from async2v.cli import Configurator, Command
 from async2v.components.base import IteratingComponent, EventDrivenComponent
+from async2v.error import ConfigurationError
 from async2v.fields import Output, Latest
-from async2v.util import parse_resolution
+from async2v.util import parse_resolution, run_in_executor
 
 try:
     import cv2
@@ -47,29 +48,32 @@ class Frame:
     Name of the source. For frames emitted by builtin components, this is the `component id <Component.id>`.
     """
 
-    @property
-    def width(self) -> int:
-        """
-        Width of `image`
-        """
-        return self.image.shape[1]
+    width: int = field(init=False, repr=False, compare=False)
+    """
+    :type: int
 
-    @property
-    def height(self) -> int:
-        """
-        Height of `image`
-        """
-        return self.image.shape[0]
+    Width of `image`
+    """
 
-    @property
-    def channels(self) -> int:
-        """
-        Number of channels of `image`
-        """
-        try:
-            return self.image.shape[2]
-        except IndexError:
-            return 1
+    height: int = field(init=False, repr=False, compare=False)
+    """
+    :type: int
+
+    Height of `image`
+    """
+
+    channels: int = field(init=False, repr=False, compare=False)
+    """
+    :type: int
+
+    Number of channels of `image`
+    """
+
+    def __post_init__(self):
+        shape = self.image.shape
+        object.__setattr__(self, 'width', shape[1])
+        object.__setattr__(self, 'height', shape[0])
+        object.__setattr__(self, 'channels', shape[2] if len(shape) > 2 else 1)
 
 
 @dataclass
@@ -99,6 +103,31 @@ class VideoSourceConfig:
     Resolution (width, height)
     """
 
+    backend: str = None
+    """
+    :type: str
+
+    Name of the OpenCV capture backend without the ``CAP_`` prefix (e.g. ``V4L2`` or ``GSTREAMER``).
+    Selected automatically by OpenCV if not specified.
+    """
+
+    live: bool = None
+    """
+    :type: bool
+
+    Whether the source is a live stream (e.g. a camera or a network stream) whose buffered frames are skipped to
+    always deliver the most recent one. Defaults to `True` for camera indices and `False` for everything else.
+    """
+
+
+def _capture_api(backend: Optional[str]) -> int:
+    if backend is None:
+        return cv2.CAP_ANY
+    api = getattr(cv2, 'CAP_' + backend.upper(), None)
+    if api is None or (api != cv2.CAP_ANY and api not in cv2.videoio_registry.getBackends()):
+        raise ConfigurationError(f'Unknown OpenCV capture backend {backend}')
+    return api
+
 
 class VideoSourceConfigurator(Configurator):
     """
@@ -115,6 +144,14 @@ class VideoSourceConfigurator(Configurator):
         group.add_argument('--source-fps', metavar='FPS', type=int,
                            help='Fps of video source, autodetected if not specified')
         group.add_argument('--source-resolution', metavar='WIDTHxHEIGHT')
+        group.add_argument('--source-backend', metavar='BACKEND',
+                           help='OpenCV capture backend (e.g. V4L2, GSTREAMER), autoselected if not specified or ANY')
+        live_group = group.add_mutually_exclusive_group()
+        live_group.add_argument('--source-live', dest='source_live', action='store_const', const=True,
+                                help='Treat the source as live stream and skip buffered frames. '
+                                     'Default for cameras.')
+        live_group.add_argument('--source-buffered', dest='source_live', action='store_const', const=False,
+                                help='Read every frame of the source at the given fps. Default for files and URLs.')
 
     @property
     def commands(self) -> List[Command]:
@@ -136,7 +173,7 @@ class VideoSourceConfigurator(Configurator):
             fps = args.source_fps
         else:
             print(f'Autodetecting fps from source {path}')
-            temp_cap = cv2.VideoCapture(path)
+            temp_cap = cv2.VideoCapture(path, _capture_api(args.source_backend))
             fps = temp_cap.get(cv2.CAP_PROP_FPS)
             temp_cap.release()
             print(f'Detected fps: {fps}')
@@ -147,7 +184,7 @@ class VideoSourceConfigurator(Configurator):
             resolution = parse_resolution(args.source_resolution)
         else:
             resolution = None
-        return VideoSourceConfig(path, int(fps), resolution)
+        return VideoSourceConfig(path, int(fps), resolution, args.source_backend, args.source_live)
 
 
 class VideoSource(IteratingComponent):
@@ -156,6 +193,8 @@ class VideoSource(IteratingComponent):
 
     Reads from a video file or a camera at a given framerate.
     The frames are pushed to the provided event key wrapped in `Frame` objects.
+    The capture is handled by a dedicated background thread. Live sources are drained continuously, so each processing
+    step delivers the most recent frame instead of one that has been waiting in the capture buffer.
     Supports full command line configuration via `VideoSourceConfigurator`.
     """
 
@@ -175,10 +214,16 @@ class VideoSource(IteratingComponent):
         self._target_fps = config.fps
         self.output = Output(key)
         self.debug_output = Output(event.OPENCV_FRAME_EVENT)
-        self._executor = ThreadPoolExecutor(max_workers=1)
         self._resolution = config.resolution
         self._resolution_verified = False
+        self._api_preference = _capture_api(config.backend)
         self._capture: cv2.VideoCapture = None
+        self._live = config.live if config.live is not None else isinstance(config.path, int)
+        self._capture_thread: threading.Thread = None
+        self._stop_capture = threading.Event()
+        self._frame_requested = threading.Event()
+        self._retrieved: asyncio.Queue = None
+        self._loop: asyncio.AbstractEventLoop = None
 
     @property
     def target_fps(self) -> int:
@@ -189,16 +234,68 @@ class VideoSource(IteratingComponent):
         return '#8080F0', '#FBFBFF'
 
     async def setup(self):
-        await asyncio.get_event_loop().run_in_executor(self._executor, self._create_capture)
+        self._loop = asyncio.get_event_loop()
+        self._retrieved = asyncio.Queue(maxsize=1)
+        self._capture_thread = threading.Thread(target=self._run_capture, name=f'{self.id}-capture', daemon=True)
+        self._capture_thread.start()
+
+    def _run_capture(self):
+        # Only this thread accesses the capture, from creation to release
+        result = (False, None)
+        try:
+            self._create_capture()
+            if self._live:
+                self._grab_continuously()
+            else:
+                self._read_on_request()
+        except Exception as e:
+            result = e
+        finally:
+            if self._capture:
+                self._capture.release()
+            self._loop.call_soon_threadsafe(self._deliver, result)
 
     def _create_capture(self):
-        self._capture = cv2.VideoCapture(self._path)
+        self._capture = cv2.VideoCapture(self._path, self._api_preference)
         if self._resolution:
             self._capture.set(cv2.CAP_PROP_FRAME_WIDTH, self._resolution[0])
             self._capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self._resolution[1])
 
+    def _grab_continuously(self):
+        while not self._stop_capture.is_set():
+            if not self._capture.grab():
+                return
+            if self._frame_requested.is_set():
+                self._frame_requested.clear()
+                self._loop.call_soon_threadsafe(self._deliver, self._capture.retrieve())
+
+    def _read_on_request(self):
+        while True:
+            self._frame_requested.wait()
+            if self._stop_capture.is_set():
+                return
+            self._frame_requested.clear()
+            ret, image = self._capture.read()
+            if not ret:
+                return
+            self._loop.call_soon_threadsafe(self._deliver, (ret, image))
+
+    def _deliver(self, result):
+        if self._retrieved.full():
+            self._retrieved.get_nowait()
+        self._retrieved.put_nowait(result)
+
+    async def _next_frame(self) -> Tuple[bool, Optional[numpy.ndarray]]:
+        if not self._capture_thread.is_alive() and self._retrieved.empty():
+            return False, None
+        self._frame_requested.set()
+        result = await self._retrieved.get()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
     async def process(self):
-        ret, image = await asyncio.get_event_loop().run_in_executor(self._executor, self._capture.read)
+        ret, image = await self._next_frame()
         if ret:
             frame = Frame(image, self.id)
             if not self._resolution_verified:
@@ -218,10 +315,19 @@ class VideoSource(IteratingComponent):
         self.logger.info(f'Source resolution {frame.width}x{frame.height}')
 
     async def cleanup(self):
-        await asyncio.get_event_loop().run_in_executor(self._executor, self._release_capture)
+        self._stop_capture.set()
+        self._frame_requested.set()
+        if self._capture_thread:
+            await run_in_executor(self._capture_thread.join)
+
+
+def _poll_key() -> int:
+    return cv2.waitKey(1)
+
 
-    def _release_capture(self):
-        self._capture.release()
+# pollKey (OpenCV >= 4.5.3) handles window events without blocking for a millisecond like waitKey(1)
+if hasattr(cv2, 'pollKey'):
+    _poll_key = cv2.pollKey
 
 
 class SimpleDisplaySink(EventDrivenComponent):
@@ -241,10 +347,8 @@ class SimpleDisplaySink(EventDrivenComponent):
 
     async def process(self):
         cv2.imshow(self.id, self.input.value.image)
-        result = cv2.waitKey(1)
-        if result == -1:
-            pass
-        elif result & self.ESCAPE == self.ESCAPE:
+        # Only the lowest byte holds the key code. No key pressed (-1) never matches.
+        if (_poll_key() & 0xFF) == self.ESCAPE:
             self.shutdown()
 
     async def cleanup(self):
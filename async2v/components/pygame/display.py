@@ -1,16 +1,16 @@
 import argparse
-import time
 from dataclasses import dataclass
-from typing import Tuple, List
+from typing import Tuple, List, Dict
 
 import cv2
+import numpy
 import pygame
 
 from async2v.application.metric import Fps, Duration
 from async2v.cli import Configurator, Command
 from async2v.components.base import SubComponent
 from async2v.components.opencv.video import Frame
-from async2v.components.pygame._layout import best_regular_screen_layout
+from async2v.components.pygame._layout import cached_best_regular_screen_layout
 from async2v.components.pygame.fonts import BEDSTEAD
 from async2v.components.pygame.gui import render_hud_text
 from async2v.components.pygame.mouse import MouseRegion
@@ -151,11 +151,11 @@ class AuxiliaryOpenCvDisplay(AuxiliaryDisplay):
         """
         super().__init__(config)
         self.input = Latest(source)  # type: Latest[Frame]
+        self._scaled = _ScaledFrames()
 
     def draw(self, surface: pygame.Surface) -> None:
         if self.input.value:
-            frame_surface = _opencv_to_pygame(self.input.value)
-            pygame.transform.scale(frame_surface, surface.get_size(), surface)
+            surface.blit(self._scaled.scale([self.input.value], [surface.get_size()])[0], (0, 0))
 
 
 class OpenCvDisplay(Display):
@@ -174,6 +174,8 @@ class OpenCvDisplay(Display):
         :param source: Key of input event. Needs to provide `Frame` events.
         """
         self.input: Latest[Frame] = Latest(source)
+        self._scaled = _ScaledFrames()
+        self._target = None  # type: Tuple[pygame.Surface, Tuple, pygame.Rect, pygame.Surface]
 
     @property
     def graph_colors(self) -> Tuple[str, str]:
@@ -181,13 +183,20 @@ class OpenCvDisplay(Display):
 
     def draw(self, surface: pygame.Surface) -> List[MouseRegion]:
         surface.fill(self.BG_COLOR)
-        if not self.input.value:
+        frame = self.input.value
+        if not frame:
             return []
-        frame_surface = _opencv_to_pygame(self.input.value)
-        target_rect = frame_surface.get_rect().fit(surface.get_rect())
-        target_surface = surface.subsurface(target_rect)
-        pygame.transform.scale(frame_surface, target_rect.size, target_surface)
-        return [MouseRegion(self.input.value.source, target_rect, (self.input.value.width, self.input.value.height))]
+        frame_size = (frame.width, frame.height)
+        target_rect, target_surface = self._target_for(surface, frame_size)
+        target_surface.blit(self._scaled.scale([frame], [target_rect.size])[0], (0, 0))
+        return [MouseRegion(frame.source, target_rect, frame_size)]
+
+    def _target_for(self, surface: pygame.Surface, frame_size: Tuple[int, int]) -> Tuple[pygame.Rect, pygame.Surface]:
+        signature = (surface.get_size(), frame_size)
+        if self._target is None or self._target[0] is not surface or self._target[1] != signature:
+            target_rect = pygame.Rect((0, 0), frame_size).fit(surface.get_rect())
+            self._target = surface, signature, target_rect, surface.subsurface(target_rect)
+        return self._target[2], self._target[3]
 
 
 class OpenCvMultiDisplay(Display):
@@ -195,20 +204,24 @@ class OpenCvMultiDisplay(Display):
     Pygame display drawing OpenCV frames from multiple sources
 
     Scales OpenCV frames preserving the aspect ratio and draws them into a tiled layout.
-    If the number of tiles changes, if the screen size changes or at latest after 60 seconds, the layout is reevaluated
-    and optimized for the best (largest) tile size. All tiles within a layout have the same size.
+    If the number, the sources or the sizes of the frames change or if the screen size changes, the layout is
+    reevaluated and optimized for the best (largest) tile size. All tiles within a layout have the same size.
 
     For each tile, this display returns a `MouseRegion` overlaying the displayed frame with the input frame source as
     name and the size of the input frame as `original_size`.
     """
+    #: Deprecated and ignored. The layout is only reevaluated when frames or screen size change.
     REEVALUATION_INTERVAL_SECONDS = 60
     BG_COLOR = (0, 0, 0)
 
     def __init__(self):
-        self.__number_of_elements = 0  # type: int
-        self.__surface_size = None
-        self.__last_layout_evaluation = 0  # type: float
+        self.__layout_signature = None  # type: Tuple[Tuple[int, int], Tuple[Tuple[str, int, int], ...]]
         self.__layout = None  # type: Tuple[int, int]
+        self.__surface = None  # type: pygame.Surface
+        self.__tiles = []  # type: List[Tuple[pygame.Rect, pygame.Surface]]
+        self.__background_rects = []  # type: List[pygame.Rect]
+        self.__regions = []  # type: List[MouseRegion]
+        self.__scaled = _ScaledFrames()
 
     @property
     def graph_colors(self) -> Tuple[str, str]:
@@ -224,30 +237,27 @@ class OpenCvMultiDisplay(Display):
         raise NotImplementedError
 
     def draw(self, surface: pygame.Surface) -> List[MouseRegion]:
-        surface.fill(self.BG_COLOR)
-        if len(self.frames) == 0:
+        frames = self.frames
+        if len(frames) == 0:
+            surface.fill(self.BG_COLOR)
             return []
 
-        if (len(self.frames) != self.__number_of_elements or
-                time.time() - self.__last_layout_evaluation > self.REEVALUATION_INTERVAL_SECONDS or
-                surface.get_size() != self.__surface_size):
-            self._calculate_layout(surface)
+        layout_signature = (surface.get_size(), tuple((f.source, f.width, f.height) for f in frames))
+        if surface is not self.__surface or layout_signature != self.__layout_signature:
+            self._calculate_layout(surface, frames, layout_signature)
 
-        target_size = surface.get_size()
-        element_size = (int(target_size[0] / self.__layout[0]), int(target_size[1] / self.__layout[1]))
-        regions = []
-        for i, frame in enumerate(self.frames):
-            i_x = i % self.__layout[0]
-            i_y = int(i / self.__layout[0])
-            frame_surface = _opencv_to_pygame(frame)
-            target_rect = frame_surface.get_rect().fit(pygame.Rect(i_x * element_size[0], i_y * element_size[1],
-                                                                   *element_size))
-            target_surface = surface.subsurface(target_rect)
-            pygame.transform.scale(frame_surface, target_rect.size, target_surface)
-            self.after_draw_frame(i, frame, surface, target_surface)
-            regions.append(MouseRegion(frame.source, target_rect, (frame.width, frame.height)))
+        bg_color = self.BG_COLOR
+        for rect in self.__background_rects:
+            surface.fill(bg_color, rect)
+
+        tiles = self.__tiles
+        after_draw_frame = self.after_draw_frame
+        frame_surfaces = self.__scaled.scale(frames, [target_rect.size for target_rect, _ in tiles])
+        for i, (frame, frame_surface, (_, target_surface)) in enumerate(zip(frames, frame_surfaces, tiles)):
+            target_surface.blit(frame_surface, (0, 0))
+            after_draw_frame(i, frame, surface, target_surface)
         self.after_draw(surface)
-        return regions
+        return [MouseRegion(r.name, r.rect.copy(), r.original_size) for r in self.__regions]
 
     def after_draw_frame(self, frame_index: int, frame: Frame, surface: pygame.Surface,
                          frame_surface: pygame.Surface) -> None:
@@ -267,13 +277,36 @@ class OpenCvMultiDisplay(Display):
         :param surface: pygame.Surface of the whole display
         """
 
-    def _calculate_layout(self, surface: pygame.Surface):
-        self.logger.debug(f'Re-calculating layout for {len(self.frames)} elements')
-        frame_sizes = [(f.width, f.height) for f in self.frames]
-        self.__layout = best_regular_screen_layout(frame_sizes, surface.get_size())
-        self.__last_layout_evaluation = time.time()
-        self.__number_of_elements = len(frame_sizes)
-        self.__surface_size = surface.get_size()
+    def _calculate_layout(self, surface: pygame.Surface, frames: List[Frame], layout_signature: Tuple):
+        self.logger.debug(f'Re-calculating layout for {len(frames)} elements')
+        frame_sizes = tuple((f.width, f.height) for f in frames)
+        self.__layout = cached_best_regular_screen_layout(frame_sizes, surface.get_size())
+        self.__layout_signature = layout_signature
+        self.__surface = surface
+
+        target_size = surface.get_size()
+        element_size = (target_size[0] // self.__layout[0], target_size[1] // self.__layout[1])
+        grid_size = (element_size[0] * self.__layout[0], element_size[1] * self.__layout[1])
+        self.__tiles = []
+        self.__regions = []
+        self.__background_rects = [pygame.Rect(grid_size[0], 0, target_size[0] - grid_size[0], target_size[1]),
+                                   pygame.Rect(0, grid_size[1], grid_size[0], target_size[1] - grid_size[1])]
+        for i in range(self.__layout[0] * self.__layout[1]):
+            i_y, i_x = divmod(i, self.__layout[0])
+            cell = pygame.Rect(i_x * element_size[0], i_y * element_size[1], *element_size)
+            if i >= len(frame_sizes):
+                self.__background_rects.append(cell)
+                continue
+            target_rect = pygame.Rect((0, 0), frame_sizes[i]).fit(cell)
+            self.__tiles.append((target_rect, surface.subsurface(target_rect)))
+            self.__regions.append(MouseRegion(frames[i].source, target_rect, frame_sizes[i]))
+            self.__background_rects += [
+                pygame.Rect(cell.left, cell.top, cell.width, target_rect.top - cell.top),
+                pygame.Rect(cell.left, target_rect.bottom, cell.width, cell.bottom - target_rect.bottom),
+                pygame.Rect(cell.left, target_rect.top, target_rect.left - cell.left, target_rect.height),
+                pygame.Rect(target_rect.right, target_rect.top, cell.right - target_rect.right, target_rect.height),
+            ]
+        self.__background_rects = [rect for rect in self.__background_rects if rect.width > 0 and rect.height > 0]
 
 
 class OpenCvDebugDisplay(OpenCvMultiDisplay):
@@ -296,41 +329,133 @@ class OpenCvDebugDisplay(OpenCvMultiDisplay):
         self.input: LatestBy[str, Frame] = LatestBy(OPENCV_FRAME_EVENT, lambda frame: frame.source)
         self.fps: LatestBy[str, Fps] = LatestBy(FPS_EVENT, lambda fps: fps.component_id)
         self.duration: LatestBy[str, Duration] = LatestBy(DURATION_EVENT, lambda d: d.component_id)
+        # Categories are never removed from a LatestBy field, so the sorted keys only change when their number does
+        self._sources = []  # type: List[str]
+        self._metric_keys_count = (0, 0)
+        self._metric_keys = []  # type: List[str]
+        self._metric_id_length = 0
+        self._font_size = None  # type: Tuple[Tuple[int, int], int]
 
     @property
     def frames(self) -> [Frame]:
-        return [v for k, v in sorted(self.input.value_dict.items(), key=lambda item: item[0])]
+        events = self.input.events
+        if len(events) != len(self._sources):
+            self._sources = sorted(events)
+        return [events[source].value for source in self._sources]
 
     def after_draw_frame(self, frame_index: int, frame: Frame, surface: pygame.Surface,
                          frame_surface: pygame.Surface) -> None:
-        s = length_normalizer(surface.get_size())
-        font_size = s(20)
-        render_hud_text(frame_surface, frame.source, self.FONT, font_size, fgcolor=self.FONT_COLOR,
+        render_hud_text(frame_surface, frame.source, self.FONT, self._font_size_for(surface), fgcolor=self.FONT_COLOR,
                         bgcolor=self.FONT_BG_COLOR, position=(0, 1))
 
     def after_draw(self, surface: pygame.Surface):
-        if not self.fps.value_dict:
+        fps_events = self.fps.events
+        duration_events = self.duration.events
+        if not fps_events:
             return
-        s = length_normalizer(surface.get_size())
-        font_size = s(20)
-        combined_keys = sorted(set(list(self.fps.value_dict) + list(self.duration.value_dict)))
-        id_length = max([len(key) for key in combined_keys])
-
-        # TODO there might be optimization potential: the fps dict is not updated all the time
-        text = ''
-        for i_y, key in enumerate(combined_keys):
-            fps = self.fps.value_dict.get(key, None)
-            duration = self.duration.value_dict.get(key, None)
-            text += f'{key:{id_length}s}: '
-            text += f'{duration.duration_seconds:4.03f}s' if duration else ' ' * 7
-            text += ' | '
-            text += f'{fps.current:5.01f}/{fps.target:3d}fps' if fps else ' ' * 12
-            text += '\n'
-
-        render_hud_text(surface, text, self.FONT, font_size, fgcolor=self.FONT_COLOR, bgcolor=self.FONT_BG_COLOR,
-                        position=(1, 0))
-
-
-def _opencv_to_pygame(frame: Frame) -> pygame.Surface:
-    conversion = cv2.COLOR_GRAY2RGB if frame.channels == 1 else cv2.COLOR_BGR2RGB
-    return pygame.surfarray.make_surface(cv2.transpose(cv2.cvtColor(frame.image, conversion))).convert()
+        if (len(fps_events), len(duration_events)) != self._metric_keys_count:
+            self._metric_keys_count = (len(fps_events), len(duration_events))
+            self._metric_keys = sorted(set(fps_events) | set(duration_events))
+            self._metric_id_length = max([len(key) for key in self._metric_keys])
+        id_length = self._metric_id_length
+
+        lines = []
+        for key in self._metric_keys:
+            fps = fps_events[key].value if key in fps_events else None
+            duration = duration_events[key].value if key in duration_events else None
+            duration_text = f'{duration.duration_seconds:4.03f}s' if duration else ' ' * 7
+            fps_text = f'{fps.current:5.01f}/{fps.target:3d}fps' if fps else ' ' * 12
+            lines.append(f'{key:{id_length}s}: {duration_text} | {fps_text}\n')
+        text = ''.join(lines)
+
+        render_hud_text(surface, text, self.FONT, self._font_size_for(surface), fgcolor=self.FONT_COLOR,
+                        bgcolor=self.FONT_BG_COLOR, position=(1, 0))
+
+    def _font_size_for(self, surface: pygame.Surface) -> int:
+        size = surface.get_size()
+        if self._font_size is None or self._font_size[0] != size:
+            self._font_size = size, length_normalizer(size)(20)
+        return self._font_size[1]
+
+
+def _supports_bgr_buffers() -> bool:
+    try:
+        pygame.image.frombuffer(bytes(3), (1, 1), 'BGR')
+        return True
+    except ValueError:
+        return False
+
+
+# Older pygame versions cannot read BGR buffers directly
+_BGR_BUFFERS = _supports_bgr_buffers()
+
+_GRAY_PALETTE = [(i, i, i) for i in range(256)]
+
+
+class _ScaledFrames:
+    """
+    Keeps the frames drawn in the last iteration, scaled to their target size and converted to display format
+
+    Sources usually deliver frames at a lower rate than the display is redrawn, so most frames can be drawn again
+    without another conversion. Surfaces of frames that are no longer drawn are reused for new frames of the same
+    size, so a source delivering a steady stream of frames does not cause a surface allocation per frame.
+    """
+
+    def __init__(self):
+        self._surfaces = {}  # type: Dict[Tuple[int, Tuple[int, int]], Tuple[Frame, pygame.Surface]]
+
+    def scale(self, frames: List[Frame], sizes: List[Tuple[int, int]]) -> List[pygame.Surface]:
+        surfaces = {}
+        for frame, size in zip(frames, sizes):
+            cached = self._surfaces.get((id(frame), size))
+            # Holding the frame guarantees that its id is not reused by another frame
+            if cached is not None and cached[0] is frame:
+                surfaces[(id(frame), size)] = cached
+        unused = [surface for key, (_, surface) in self._surfaces.items() if key not in surfaces]
+        for frame, size in zip(frames, sizes):
+            if (id(frame), size) not in surfaces:
+                target = next((s for s in unused if s.get_size() == size), None)
+                if target is not None:
+                    unused.remove(target)
+                surfaces[(id(frame), size)] = frame, _opencv_to_pygame(frame, size, target)
+        self._surfaces = surfaces
+        return [surfaces[(id(frame), size)][1] for frame, size in zip(frames, sizes)]
+
+
+def _opencv_to_pygame(frame: Frame, size: Tuple[int, int] = None, target: pygame.Surface = None) -> pygame.Surface:
+    """
+    Convert the frame to a surface in display format
+
+    The frame is scaled to size (nearest neighbor, like ``pygame.transform.scale``) if given. Scaling happens before
+    the conversion, so only the scaled pixels are converted. If given, the result is drawn to target, which needs to
+    be of the scaled size. Otherwise a new surface is created.
+    """
+    image = frame.image
+    if size is not None and size != (frame.width, frame.height):
+        if 0 in size:
+            return pygame.Surface(size).convert()
+        image = cv2.resize(image, size, interpolation=cv2.INTER_NEAREST)
+    source = _image_surface(image)
+    if target is None:
+        return source.convert()
+    target.blit(source, (0, 0))
+    return target
+
+
+def _image_surface(image: numpy.ndarray) -> pygame.Surface:
+    size = (image.shape[1], image.shape[0])
+    channels = image.shape[2] if image.ndim > 2 else 1
+    if image.dtype == numpy.uint8 and channels == 1:
+        # Gray values are used as palette indices, so the image does not need to be expanded to three channels
+        surface = pygame.image.frombuffer(numpy.ascontiguousarray(image), size, 'P')
+        surface.set_palette(_GRAY_PALETTE)
+        return surface
+    if image.dtype == numpy.uint8 and channels == 3:
+        if _BGR_BUFFERS:
+            return pygame.image.frombuffer(numpy.ascontiguousarray(image), size, 'BGR')
+        return pygame.image.frombuffer(cv2.cvtColor(image, cv2.COLOR_BGR2RGB), size, 'RGB')
+    if channels == 1:
+        image = numpy.broadcast_to(image.reshape(size[1], size[0], 1), (size[1], size[0], 3))
+    else:
+        image = image[:, :, 2::-1]
+    return pygame.surfarray.make_surface(image.swapaxes(0, 1))
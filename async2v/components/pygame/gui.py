@@ -4,7 +4,9 @@ Very simple and basic gui elements.
 Gui elements have a fixed height and a minimal width. They can only be aligned in vertical stacked groups.
 Afterwards, all elements are drawn with the same width, which is the width of the widest element.
 """
-from typing import List, Tuple, Callable
+from functools import lru_cache
+from itertools import count
+from typing import List, Tuple, Callable, Optional, Hashable
 
 import pygame.freetype
 
@@ -30,6 +32,16 @@ class GuiElement:
     def min_width(self) -> int:
         raise NotImplementedError
 
+    @property
+    def render_key(self) -> Optional[Hashable]:
+        """
+        Value that changes whenever the element would be drawn differently
+
+        A `Menu` reuses its last rendering while the keys of all its elements stay the same. Defaults to None, which
+        means that the element is drawn again on each frame.
+        """
+        return None
+
     def draw(self, surface: pygame.Surface) -> List[MouseRegion]:
         raise NotImplementedError
 
@@ -80,19 +92,36 @@ class Menu:
         self.position = position
         self.bgcolor = bgcolor
         self.padding = padding
+        self._rendered = None  # type: Tuple[Tuple, Tuple[pygame.Surface, Tuple[float, float], List[MouseRegion]]]
 
     def draw(self, surface: pygame.Surface) -> List[MouseRegion]:
         """
         Draw the menu on the given pygame surface.
         """
+        depth = max(surface.get_bitsize(), 16)
+        key = self._render_key(depth)
+        if key is None or self._rendered is None or self._rendered[0] != key:
+            rendered = self._render(depth)
+            self._rendered = None if key is None else (key, rendered)
+        else:
+            rendered = self._rendered[1]
+        bg_surface, size, regions = rendered
+        x, y = _blit_at_position(surface, bg_surface, size, self.position)
+        return [r.move(x, y) for r in regions]
+
+    def _render_key(self, depth: int) -> Optional[Tuple]:
+        element_keys = tuple(e.render_key for e in self.elements)
+        if None in element_keys:
+            return None
+        return depth, _color_key(self.bgcolor), self.padding, tuple(self.elements), element_keys
+
+    def _render(self, depth: int) -> Tuple[pygame.Surface, Tuple[float, float], List[MouseRegion]]:
         element_width = max([e.min_width for e in self.elements])
         width = element_width + 2 * self.padding
         total_height = sum([e.height for e in self.elements]) + (len(self.elements) + 1) * self.padding
-        available_width = surface.get_width() - width
-        available_height = surface.get_height() - total_height
 
         # TODO There might be a more elegant way to ensure the bit depth is sufficient
-        bg_surface = pygame.Surface((width, total_height), pygame.SRCALPHA, depth=max(surface.get_bitsize(), 16))
+        bg_surface = pygame.Surface((width, total_height), pygame.SRCALPHA, depth=depth)
         if self.bgcolor is not None:
             bg_surface.fill(self.bgcolor)
 
@@ -102,11 +131,7 @@ class Menu:
             rect = pygame.Rect(self.padding, element_y + self.padding, element_width, element.height)
             regions += element.draw(bg_surface.subsurface(rect))
             element_y += element.height + self.padding
-
-        x = available_width * self.position[0]
-        y = available_height * self.position[1]
-        surface.blit(bg_surface, pygame.Rect(x, y, width, total_height))
-        return [r.move(x, y) for r in regions]
+        return bg_surface, (width, total_height), regions
 
     def handle_mouse_events(self, events: List[MouseEvent]):
         """
@@ -135,6 +160,7 @@ class Label(GuiElement):
         self._size = size
         self._font = font if font else BEDSTEAD
         self._text = text
+        self._lines = text.splitlines()
         self.align = align
         self.fgcolor = fgcolor
         self.bgcolor = bgcolor
@@ -148,16 +174,16 @@ class Label(GuiElement):
     @text.setter
     def text(self, value: str):
         self._text = value
+        self._lines = value.splitlines()
         self._calculate_dimensions()
 
     def _calculate_dimensions(self):
-        lines = self._text.splitlines()
-        preview_rects = [self._font.get_rect(line, size=self._size) for line in lines]
-        font_line_height = self._font.get_sized_height(self._size)
+        line_widths = [_line_width(self._font, line, self._size) for line in self._lines]
+        font_line_height = _sized_height(self._font, self._size)
         self._extra = font_line_height * 0.2
         self._line_height = font_line_height + 2 * self._extra
-        self._height = self._line_height * len(lines)
-        self._width = max([r.width for r in preview_rects]) + 2 * self._extra
+        self._height = self._line_height * len(self._lines)
+        self._width = max(line_widths) + 2 * self._extra
 
     @property
     def height(self) -> int:
@@ -167,6 +193,16 @@ class Label(GuiElement):
     def min_width(self) -> int:
         return self._width
 
+    @property
+    def render_key(self) -> Optional[Hashable]:
+        # Subclasses drawing their own content may depend on state the key does not cover
+        if type(self).draw is not Label.draw:
+            return None
+        return self._label_render_key()
+
+    def _label_render_key(self) -> Tuple:
+        return self._text, self._font, self._size, self.align, _color_key(self.fgcolor), _color_key(self.bgcolor)
+
     def draw(self, surface: pygame.Surface) -> List[MouseRegion]:
         if self.bgcolor is not None:
             surface.fill(self.bgcolor)
@@ -175,23 +211,17 @@ class Label(GuiElement):
 
     def _draw_text(self, surface: pygame.Surface):
         offset = (surface.get_width() - self._width) * self.align
-        for i, line in enumerate(self._text.splitlines()):
-            self._font.render_to(surface, (self._extra + offset, self._line_height * i + self._extra), line,
-                                 size=self._size,
-                                 fgcolor=self.fgcolor)
+        fgcolor = _color_key(self.fgcolor)
+        for i, line in enumerate(self._lines):
+            line_surface = _render_line(self._font, line, self._size, fgcolor)
+            surface.blit(line_surface, (self._extra + offset, self._line_height * i + self._extra))
 
 
 class Button(Label):
     """
     Button to be part of a `Menu`
     """
-    __count = 0
-
-    def __new__(cls, *args, **kwargs):
-        __instance = super().__new__(cls)
-        __instance._numeric_id = cls.__count
-        cls.__count += 1
-        return __instance
+    _numeric_ids = count()
 
     def __init__(self, text: str, action: Callable,
                  font: pygame.freetype.Font = None, size: int = 20, align: float = 0.5,
@@ -208,6 +238,8 @@ class Button(Label):
         :param hlbgcolor: Background color as RGB or RGBA when highlighted
         """
         super().__init__(text, font, size, align, fgcolor, bgcolor)
+        self._numeric_id = next(Button._numeric_ids)
+        self._region_name = f'async2v.pygame.gui.button{self._numeric_id}'
         self._action = action
         self._hlbgcolor = hlbgcolor
         self._pressed = False
@@ -215,7 +247,13 @@ class Button(Label):
 
     @property
     def region_name(self):
-        return f'async2v.pygame.gui.button{self._numeric_id}'
+        return self._region_name
+
+    @property
+    def render_key(self) -> Optional[Hashable]:
+        if type(self).draw is not Button.draw:
+            return None
+        return self._label_render_key() + (_color_key(self._hlbgcolor), self._hover)
 
     def draw(self, surface: pygame.Surface) -> List[MouseRegion]:
         if not self._hover and self.bgcolor is not None:
@@ -223,8 +261,7 @@ class Button(Label):
         elif self._hover and self._hlbgcolor is not None:
             surface.fill(self._hlbgcolor)
         super()._draw_text(surface)
-        rect = surface.get_rect()  # type: pygame.Rect
-        rect = rect.move(*surface.get_abs_offset())
+        rect = pygame.Rect(surface.get_abs_offset(), surface.get_size())
         return [MouseRegion(self.region_name, rect, rect.size)]
 
     def handle_mouse_event(self, event: MouseEvent):
@@ -258,4 +295,43 @@ def render_hud_text(surface: pygame.Surface, text: str,
     :param bgcolor: Background color as RGB or RGBA
     :param position: Relative position within the display from (0, 0) to (1, 1). (0.5, 0.5) for center.
     """
-    Menu([Label(text, font, size, fgcolor=fgcolor, bgcolor=bgcolor)], position=position).draw(surface)
+    hud_surface, hud_size = _render_hud_text(text, font, size, _color_key(fgcolor), _color_key(bgcolor),
+                                             max(surface.get_bitsize(), 16))
+    _blit_at_position(surface, hud_surface, hud_size, position)
+
+
+@lru_cache(maxsize=32)
+def _render_hud_text(text: str, font: Optional[pygame.freetype.Font], size: int, fgcolor: Tuple,
+                     bgcolor: Optional[Tuple], depth: int) -> Tuple[pygame.Surface, Tuple[float, float]]:
+    bg_surface, bg_size, _ = Menu([Label(text, font, size, fgcolor=fgcolor, bgcolor=bgcolor)])._render(depth)
+    return bg_surface, bg_size
+
+
+@lru_cache(maxsize=256)
+def _line_width(font: pygame.freetype.Font, line: str, size: int) -> int:
+    return font.get_rect(line, size=size).width
+
+
+@lru_cache(maxsize=32)
+def _sized_height(font: pygame.freetype.Font, size: int) -> int:
+    return font.get_sized_height(size)
+
+
+@lru_cache(maxsize=256)
+def _render_line(font: pygame.freetype.Font, line: str, size: int, fgcolor: Tuple) -> pygame.Surface:
+    line_surface, _ = font.render(line, size=size, fgcolor=fgcolor)
+    return line_surface
+
+
+def _color_key(color) -> Optional[Tuple]:
+    # Colors may be given as lists or pygame.Color, neither of which is hashable
+    return None if color is None else tuple(color)
+
+
+def _blit_at_position(surface: pygame.Surface, source: pygame.Surface, size: Tuple[float, float],
+                      position: Tuple[float, float]) -> Tuple[float, float]:
+    width, height = surface.get_size()
+    x = (width - size[0]) * position[0]
+    y = (height - size[1]) * position[1]
+    surface.blit(source, pygame.Rect(x, y, *size))
+    return x, y
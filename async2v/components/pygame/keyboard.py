@@ -37,8 +37,6 @@ Example for integrating a keyboard handler into an application:
 """
 
 import argparse
-import collections
-import os.path
 from dataclasses import dataclass
 from typing import List, Dict, Tuple
 
@@ -51,6 +49,9 @@ from async2v.components.base import SubComponent
 from async2v.error import ConfigurationError
 from async2v.fields import Output, Latest
 
+# Key names as used in keyboard layouts, i.e. the pygame key constants without the K_ prefix
+_PYGAME_KEYS = {name[2:]: value for name, value in vars(pygame).items() if name.startswith('K_')}
+
 
 class Action:
     """
@@ -144,29 +145,27 @@ class KeyboardConfigurator(Configurator):
         Create a keyboard layout. Use this to construct an instance of the `KeyboardHandler` subclass this configurator
         was created from.
         """
-        if os.path.isfile(args.keyboard_layout):
+        try:
             return self.load_layout(args.keyboard_layout)
-        else:
+        except FileNotFoundError:
             return self.default_layout()
 
     def _validate_actions(self):
-        if len(self._actions) == 0:
-            return
-        # noinspection PyArgumentList
-        counter = collections.Counter((action.name for action in self._actions))
-        action, count = counter.most_common(1)[0]
-        if count > 1:
-            raise ConfigurationError(f'Duplicate keyboard action {action}')
+        names = set()
+        for action in self._actions:
+            if action.name in names:
+                raise ConfigurationError(f'Duplicate keyboard action {action.name}')
+            names.add(action.name)
 
     def load_layout(self, path: str) -> KeyboardLayout:
         logger = logwood.get_logger(self.__class__.__name__)
         bindings_by_action = {}
         with open(path) as f:
             for raw_line in f:
-                line, *_ = raw_line.split('#')
-                if not line.strip():
+                tokens = raw_line.partition('#')[0].split()
+                if not tokens:
                     continue
-                action, *bindings = line.split()
+                action, *bindings = tokens
                 if action in bindings_by_action:
                     raise ConfigurationError(f'Duplicate action {action}')
                 bindings_by_action[action] = bindings
@@ -224,16 +223,10 @@ class KeyboardConfigurator(Configurator):
     def _parse_bindings_for_action(cls, actions_by_key, actions_by_scancode, action: str, bindings: List[str]):
         for binding in bindings:
             code, is_scancode = cls._parse_binding(binding)
-            if code is not None and is_scancode:
-                if code in actions_by_scancode:
-                    raise ConfigurationError(f'Binding {binding} -> {actions_by_scancode[code]} already exists, '
-                                             f'cannot map to {action}')
-                actions_by_scancode[code] = action
-            elif code is not None and not is_scancode:
-                if code in actions_by_key:
-                    raise ConfigurationError(f'Binding {binding} -> {actions_by_key[code]} already exists, '
-                                             f'cannot map to {action}')
-                actions_by_key[code] = action
+            actions = actions_by_scancode if is_scancode else actions_by_key
+            if code in actions:
+                raise ConfigurationError(f'Binding {binding} -> {actions[code]} already exists, cannot map to {action}')
+            actions[code] = action
 
     @classmethod
     def _parse_binding(cls, binding: str) -> Tuple[int, bool]:
@@ -244,7 +237,7 @@ class KeyboardConfigurator(Configurator):
             except ValueError:
                 pass
 
-        key = vars(pygame).get('K_' + binding, None)
+        key = _PYGAME_KEYS.get(binding, None)
         if key is None:
             raise ConfigurationError(f'Invalid keybinding {binding}')
         return key, False
@@ -330,7 +323,8 @@ class KeyboardHandler(SubComponent):
             that concrete `KeyboardHandler`
         """
         self._layout = layout
-        self._pressed = {}
+        # Only currently pressed actions are kept, in the order they were pressed
+        self._pressed = {}  # type: Dict[str, bool]
         self._capture: bool = False
         self._capture_id: str = None
         self._capture_text: str = None
@@ -370,7 +364,7 @@ class KeyboardHandler(SubComponent):
         elif not self._capture:
             action = self._layout.action_by_key_or_scancode(key, scancode)
             if action:
-                self._pressed[action] = False
+                self._pressed.pop(action, None)
                 self.key_up(action)
 
     def capture_text(self, capture_id: str, initial=''):
@@ -384,10 +378,10 @@ class KeyboardHandler(SubComponent):
         self._capture = True
         self._capture_id = capture_id
         self._capture_text = initial
-        for action in self._pressed:
-            if self._pressed[action]:
-                self._pressed[action] = False
-                self.key_up(action)
+        pressed = list(self._pressed)
+        self._pressed.clear()
+        for action in pressed:
+            self.key_up(action)
         self.text_capture_update(self._capture_id, self._capture_text)
 
     def text_capture_completed(self, capture_id: str, text: str):
@@ -403,8 +397,10 @@ class KeyboardHandler(SubComponent):
     def is_pressed(self, action: str) -> bool:
         """
         Query the current state of a keyboard action
+
+        Actions that have not been pressed yet are reported as not pressed.
         """
-        return self._pressed.get(action)
+        return action in self._pressed
 
     def key_down(self, action: str) -> None:
         """
@@ -30,7 +30,7 @@ Example for integrating the main window into the application:
 import argparse
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Dict
 
 import pygame.display
 
@@ -178,6 +178,7 @@ class MainWindow(IteratingComponent, ContainerMixin):
         self._displays: List[Display] = list(displays)
         self._current_display: int = 0
         self._surface: pygame.Surface = None
+        self._display_flags: Dict[Tuple[Tuple[int, int], bool], int] = {}
 
         self._aux_display = None
         self._aux_surface = None
@@ -187,10 +188,12 @@ class MainWindow(IteratingComponent, ContainerMixin):
         self._keyboard_handler = keyboard_handler
         self._mouse_handler = mouse_handler
 
+        self._main_rect = None  # type: pygame.Rect
         self._regions = None  # type: List[MouseRegion]
 
         self._help_visible = False
         self._help_text = self._generate_help_text()
+        self._help_font_size = None  # type: float
 
     @property
     def target_fps(self) -> int:
@@ -204,6 +207,7 @@ class MainWindow(IteratingComponent, ContainerMixin):
         pygame.display.init()
         self._configure_display()
         self._configure_aux_display()
+        self._configure_main_surface()
         self._regions = [self._main_region()]
 
     async def process(self):
@@ -240,21 +244,18 @@ class MainWindow(IteratingComponent, ContainerMixin):
             self._aux_display.draw(self._aux_surface)
 
         if self._help_visible:
-            s = length_normalizer(self._surface.get_size())
             render_hud_text(self._surface, self._help_text,
                             position=(0.5, 0.5),
-                            size=min(s(30), self._surface.get_height() // (1.5 * len(self._help_text.splitlines()))),
+                            size=self._help_font_size,
                             fgcolor=self.HELP_FONT_COLOR, bgcolor=self.HELP_BG_COLOR)
 
         pygame.display.flip()
 
-    def _main_region(self) -> MouseRegion:
-        return MouseRegion(ROOT_REGION, self._surface.get_rect(), self._surface.get_size())
-
     def toggle_fullscreen(self):
         self._currently_fullscreen = not self._currently_fullscreen
         self._configure_display()
         self._configure_aux_display()
+        self._configure_main_surface()
 
     def _configure_display(self):
         config = self._display_config[self._currently_fullscreen]
@@ -271,6 +272,12 @@ class MainWindow(IteratingComponent, ContainerMixin):
         self._surface = pygame.display.set_mode(resolution, flags)
 
     def _get_best_flags_for_config(self, config: DisplayConfiguration):
+        key = (config.resolution, config.fullscreen)
+        if key not in self._display_flags:
+            self._display_flags[key] = self._probe_best_flags_for_config(config)
+        return self._display_flags[key]
+
+    def _probe_best_flags_for_config(self, config: DisplayConfiguration):
         if config.fullscreen:
             base_flags = pygame.FULLSCREEN
         else:
@@ -298,6 +305,14 @@ class MainWindow(IteratingComponent, ContainerMixin):
         else:
             self._aux_surface = None
 
+    def _configure_main_surface(self):
+        self._main_rect = self._surface.get_rect()
+        s = length_normalizer(self._surface.get_size())
+        self._help_font_size = min(s(30), self._surface.get_height() // (1.5 * len(self._help_text.splitlines())))
+
+    def _main_region(self) -> MouseRegion:
+        return MouseRegion(ROOT_REGION, self._main_rect.copy(), self._main_rect.size)
+
     def change_display(self, new_display: int):
         if 0 <= new_display < len(self._displays):
             self._current_display = new_display
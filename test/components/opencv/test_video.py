@@ -1,7 +1,13 @@
+import argparse
+from types import SimpleNamespace
 from typing import List
 
+import pytest
+
 from async2v.components.base import EventDrivenComponent
-from async2v.components.opencv.video import Frame, SimpleDisplaySink
+from async2v.components.opencv import video
+from async2v.components.opencv.video import Frame, SimpleDisplaySink, VideoSource, VideoSourceConfig
+from async2v.error import ConfigurationError
 from async2v.fields import Buffer
 
 
@@ -22,6 +28,20 @@ def test_video_source(app, video_source):
     assert sink.log[0].channels == 3
 
 
+def test_video_source_capture_error(app, video_source, monkeypatch):
+    def failing_capture(*args):
+        raise RuntimeError('Capture failed')
+
+    monkeypatch.setattr(video.cv2, 'VideoCapture', failing_capture)
+
+    app.register(video_source)
+    app.start()
+    app.join(20)
+
+    assert not app.is_alive()
+    assert app.has_error_occurred()
+
+
 def test_simple_sink(app, video_source, highgui_test_skipper):
     sink = SimpleDisplaySink('source')
 
@@ -33,6 +53,69 @@ def test_simple_sink(app, video_source, highgui_test_skipper):
     assert not app.has_error_occurred()
 
 
+def test_video_source_backend_from_args(video_file):
+    parser = argparse.ArgumentParser()
+    VideoSource.configurator().add_app_arguments(parser)
+    args = parser.parse_args(['--source-file', video_file, '--source-fps', '25', '--source-backend', 'FFMPEG'])
+
+    config = VideoSource.configurator().config_from_args(args)
+
+    assert config.backend == 'FFMPEG'
+
+
+def test_video_source_live_from_args(video_file):
+    parser = argparse.ArgumentParser()
+    VideoSource.configurator().add_app_arguments(parser)
+    args = parser.parse_args(['--source-file', video_file, '--source-fps', '25', '--source-live'])
+
+    config = VideoSource.configurator().config_from_args(args)
+
+    assert config.live
+
+
+def test_video_source_buffered_from_args():
+    parser = argparse.ArgumentParser()
+    VideoSource.configurator().add_app_arguments(parser)
+    args = parser.parse_args(['--source-camera', '0', '--source-fps', '25', '--source-buffered'])
+
+    config = VideoSource.configurator().config_from_args(args)
+
+    assert config.live is False
+
+
+def test_video_source_drains_live_stream_url(monkeypatch):
+    source = VideoSource(VideoSourceConfig('rtsp://localhost/stream', 25, live=True))
+
+    assert _capture_mode(source, monkeypatch) == 'grab'
+
+
+@pytest.mark.parametrize('path', ['frames/img_%04d.png', 'https://localhost/recording.mp4'])
+def test_video_source_reads_non_camera_sources_on_request(monkeypatch, path):
+    source = VideoSource(VideoSourceConfig(path, 25))
+
+    assert _capture_mode(source, monkeypatch) == 'read'
+
+
+def _capture_mode(source: VideoSource, monkeypatch) -> str:
+    calls = []
+    monkeypatch.setattr(source, '_create_capture', lambda: None)
+    monkeypatch.setattr(source, '_grab_continuously', lambda: calls.append('grab'))
+    monkeypatch.setattr(source, '_read_on_request', lambda: calls.append('read'))
+    source._loop = SimpleNamespace(call_soon_threadsafe=lambda *args: None)
+    source._run_capture()
+    return calls[0]
+
+
+def test_video_source_accepts_any_backend(video_file):
+    VideoSource(VideoSourceConfig(video_file, 25, backend='ANY'))
+
+
+@pytest.mark.parametrize('backend', ['NO_SUCH_BACKEND', 'PROP_FPS'])
+def test_video_source_fails_for_unknown_backend(video_file, backend):
+    with pytest.raises(ConfigurationError):
+        VideoSource(VideoSourceConfig(video_file, 25, backend=backend))
+
+
 class SampleSink(EventDrivenComponent):
     def __init__(self, key='source'):
         self.input = Buffer(key, trigger=True)
@@ -0,0 +1,97 @@
+import cv2
+import numpy
+import pygame
+import pytest
+
+from async2v.components.opencv.video import Frame
+from async2v.components.pygame import display
+from async2v.event import Event
+
+
+@pytest.fixture
+def pygame_screen(pygame_video):
+    pygame.display.set_mode((1, 1))  # required for Surface.convert()
+
+
+def _sample_image():
+    return numpy.random.default_rng(1).integers(0, 256, (6, 8, 3), dtype=numpy.uint8)
+
+
+@pytest.mark.parametrize('bgr_buffers', [True, False])
+@pytest.mark.parametrize('image, expected_rgb', [
+    (_sample_image(), cv2.cvtColor(_sample_image(), cv2.COLOR_BGR2RGB)),
+    (_sample_image()[1:5, 2:7], cv2.cvtColor(_sample_image()[1:5, 2:7], cv2.COLOR_BGR2RGB)),
+    (_sample_image()[:, :, 0], cv2.cvtColor(_sample_image()[:, :, 0], cv2.COLOR_GRAY2RGB)),
+])
+def test_opencv_to_pygame(pygame_screen, monkeypatch, bgr_buffers, image, expected_rgb):
+    monkeypatch.setattr(display, '_BGR_BUFFERS', display._BGR_BUFFERS and bgr_buffers)
+
+    surface = display._opencv_to_pygame(Frame(image, 'test'))
+
+    assert surface.get_size() == (image.shape[1], image.shape[0])
+    assert numpy.array_equal(pygame.surfarray.array3d(surface).swapaxes(0, 1), expected_rgb)
+
+
+def test_unchanged_frames_are_converted_once(pygame_screen, monkeypatch):
+    converted = []
+
+    def opencv_to_pygame(frame: Frame, size, target: pygame.Surface = None) -> pygame.Surface:
+        converted.append(frame)
+        return pygame.Surface(size)
+
+    monkeypatch.setattr(display, '_opencv_to_pygame', opencv_to_pygame)
+    surface = pygame.Surface((40, 30))
+    opencv_display = display.OpenCvDisplay('source')
+    first = Frame(_sample_image(), 'source')
+    second = Frame(_sample_image(), 'source')
+
+    opencv_display.input.set(Event('source', first))
+    opencv_display.input.switch()
+    opencv_display.draw(surface)
+    opencv_display.draw(surface)
+    opencv_display.input.set(Event('source', second))
+    opencv_display.input.switch()
+    opencv_display.draw(surface)
+    opencv_display.draw(surface)
+
+    assert [id(frame) for frame in converted] == [id(first), id(second)]
+
+
+@pytest.mark.parametrize('image', [_sample_image(), _sample_image()[:, :, 0]])
+def test_opencv_to_pygame_scaled_to_target(pygame_screen, image):
+    target = pygame.Surface((5, 9)).convert()
+    expected = cv2.resize(image, (5, 9), interpolation=cv2.INTER_NEAREST)
+    if expected.ndim == 2:
+        expected = cv2.cvtColor(expected, cv2.COLOR_GRAY2BGR)
+
+    surface = display._opencv_to_pygame(Frame(image, 'test'), (5, 9), target)
+
+    assert surface is target
+    assert numpy.array_equal(pygame.surfarray.array3d(surface).swapaxes(0, 1), expected[:, :, ::-1])
+
+
+@pytest.mark.parametrize('dtype', [numpy.uint16, numpy.float32, numpy.float64])
+def test_opencv_to_pygame_gray_without_uint8(pygame_screen, dtype):
+    image = (_sample_image()[:, :, 0] // 2).astype(dtype)
+
+    surface = display._opencv_to_pygame(Frame(image, 'test'))
+
+    expected = numpy.repeat(image.astype(numpy.uint8)[:, :, None], 3, axis=2)
+    assert numpy.array_equal(pygame.surfarray.array3d(surface).swapaxes(0, 1), expected)
+
+
+def test_multi_display_regions_are_not_shared_between_draws(pygame_screen):
+    class SampleMultiDisplay(display.OpenCvMultiDisplay):
+        @property
+        def frames(self):
+            return [Frame(_sample_image(), 'a'), Frame(_sample_image(), 'b')]
+
+    surface = pygame.Surface((40, 30))
+    multi_display = SampleMultiDisplay()
+
+    first = multi_display.draw(surface)
+    expected = [region.rect.copy() for region in first]
+    for region in first:
+        region.rect.move_ip(5, 5)
+
+    assert [region.rect for region in multi_display.draw(surface)] == expected
@@ -0,0 +1,73 @@
+from typing import List
+
+import pygame
+import pygame.freetype
+import pytest
+
+from async2v.components.pygame import gui
+from async2v.components.pygame.mouse import MouseEvent, MouseEventType, MouseRegion
+
+
+@pytest.fixture
+def rendered(pygame_video, monkeypatch) -> List[gui.Menu]:
+    pygame.freetype.init()
+    rendered = []
+    render = gui.Menu._render
+
+    def counting_render(menu: gui.Menu, depth: int):
+        rendered.append(menu)
+        return render(menu, depth)
+
+    monkeypatch.setattr(gui.Menu, '_render', counting_render)
+    return rendered
+
+
+def test_unchanged_menu_is_rendered_once(rendered):
+    surface = pygame.Surface((200, 100))
+    menu = gui.Menu([gui.Label('label'), gui.Button('button', lambda: None)])
+
+    menu.draw(surface)
+    menu.draw(surface)
+
+    assert len(rendered) == 1
+
+
+def test_menu_is_rendered_again_on_text_change(rendered):
+    surface = pygame.Surface((200, 100))
+    label = gui.Label('label')
+    menu = gui.Menu([label])
+
+    menu.draw(surface)
+    label.text = 'changed'
+    menu.draw(surface)
+    menu.draw(surface)
+
+    assert len(rendered) == 2
+
+
+def test_menu_is_rendered_again_on_hover(rendered):
+    surface = pygame.Surface((200, 100))
+    button = gui.Button('button', lambda: None)
+    menu = gui.Menu([button])
+
+    regions = menu.draw(surface)
+    region = MouseRegion(button.region_name, regions[0].rect, regions[0].rect.size)
+    menu.handle_mouse_events([MouseEvent(region, (0, 0), MouseEventType.ENTER)])
+    menu.draw(surface)
+    menu.draw(surface)
+
+    assert len(rendered) == 2
+
+
+def test_menu_with_custom_drawn_label_is_rendered_on_each_draw(rendered):
+    class CustomLabel(gui.Label):
+        def draw(self, surface: pygame.Surface) -> List[MouseRegion]:
+            return super().draw(surface)
+
+    surface = pygame.Surface((200, 100))
+    menu = gui.Menu([CustomLabel('label')])
+
+    menu.draw(surface)
+    menu.draw(surface)
+
+    assert len(rendered) == 2
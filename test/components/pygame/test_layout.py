@@ -12,7 +12,7 @@ from async2v.components.pygame import _layout
     (11, [(1, 11), (2, 6), (3, 4), (4, 3), (6, 2), (11, 1)]),
 ])
 def test_possible_screen_layouts(number_of_screens, expected_layouts):
-    assert _layout.possible_screen_layouts(number_of_screens) == expected_layouts
+    assert _layout.possible_screen_layouts(number_of_screens) == tuple(expected_layouts)
 
 
 @pytest.mark.parametrize('frames, screen_size, expected', [
@@ -21,6 +21,10 @@ def test_possible_screen_layouts(number_of_screens, expected_layouts):
     ([(100, 100), (100, 100)], (100, 200), (1, 2)),
     ([(100, 50), (200, 200), (200, 200)], (200, 200), (2, 2)),
     ([(100, 50), (300, 100), (300, 150)], (200, 200), (1, 3)),
+    ([(640, 480)] * 20 + [(1280, 720)] * 10, (1920, 1080), (6, 5)),
+    ([(100, 50)] * 17 + [(50, 100)] * 3, (200, 200), (3, 7)),
+    ([(100, 100)] * 25, (1000, 1000), (5, 5)),
 ])
 def test_best_regular_screen_layout(frames, screen_size, expected):
     assert _layout.best_regular_screen_layout(frames, screen_size) == expected
+    assert _layout.cached_best_regular_screen_layout(tuple(frames), screen_size) == expected